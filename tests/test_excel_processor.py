@@ -3,6 +3,7 @@
 This module tests the core Excel processing functionality and payment terms import.
 """
 
+import re
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -10,6 +11,7 @@ from unittest.mock import Mock, patch
 import pytest
 from openpyxl import Workbook
 
+from xlsx_reader import excel_processor
 from xlsx_reader.excel_processor import (
     PaymentTerm,
     create_payment_terms_batch_qbxml,
@@ -50,6 +52,13 @@ def create_payment_terms_excel(file_path: str) -> None:
 class TestPaymentTerms:
     """Test cases for payment terms functionality."""
 
+    @pytest.fixture(autouse=True)
+    def qb_connection_cache(self):
+        """Isolate the process-wide QuickBooks connection cache per test."""
+        excel_processor._QB_CONN = None
+        yield
+        excel_processor._QB_CONN = None
+
     @pytest.fixture
     def payment_terms_excel_file(self):
         """Create a temporary Excel file with payment terms for testing."""
@@ -72,6 +81,13 @@ class TestPaymentTerms:
         assert term.name == "Net 30"
         assert term.discount_days == 30
 
+    def test_payment_term_validates_at_construction(self):
+        """Test that PaymentTerm rejects invalid fields when constructed."""
+        with pytest.raises(ValueError):
+            PaymentTerm(name="   ", discount_days=30)
+        with pytest.raises(TypeError):
+            PaymentTerm(name="Net 30", discount_days="30")
+
     def test_read_payment_terms(self, payment_terms_excel_file):
         """Test reading payment terms from Excel file."""
         payment_terms = read_payment_terms(payment_terms_excel_file)
@@ -84,6 +100,32 @@ class TestPaymentTerms:
         assert payment_terms[4].name == "Cash On Delivery"
         assert payment_terms[4].discount_days == 0
 
+    def test_read_payment_terms_skips_boolean_day_cells(self):
+        """Test that boolean cells in the days column are rejected, not read as 0/1."""
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        sheet = workbook.create_sheet("payment_terms")
+        sheet["A1"] = "Name"
+        sheet["B1"] = "ID"
+        sheet["A2"] = "Net 30"
+        sheet["B2"] = 30
+        sheet["A3"] = "Bogus"
+        sheet["B3"] = True
+
+        tmp = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
+        tmp_path = Path(tmp.name)
+        try:
+            tmp.close()
+            workbook.save(str(tmp_path))
+            payment_terms = read_payment_terms(str(tmp_path))
+        finally:
+            try:
+                tmp_path.unlink()
+            except PermissionError:
+                pass
+
+        assert [term.name for term in payment_terms] == ["Net 30"]
+
     def test_create_payment_terms_batch_qbxml(self):
         """Test batch QBXML generation for payment terms."""
         terms = [
@@ -99,6 +141,14 @@ class TestPaymentTerms:
         assert "<Name>Net 15</Name>" in qbxml
         assert "<StdDueDays >15</StdDueDays >" in qbxml
 
+    def test_create_payment_terms_batch_qbxml_escapes_names(self):
+        """Test that XML-special characters in term names are escaped."""
+        terms = [PaymentTerm(name="Cash & Carry <30>", discount_days=30)]
+        qbxml = create_payment_terms_batch_qbxml(terms)
+
+        assert "<Name>Cash &amp; Carry &lt;30&gt;</Name>" in qbxml
+        assert "<Name>Cash & Carry" not in qbxml
+
     @patch("xlsx_reader.excel_processor.win32com.client.Dispatch")
     def test_save_payment_terms_to_quickbooks_success(self, mock_dispatch):
         """Test successful save to QuickBooks."""
@@ -119,11 +169,48 @@ class TestPaymentTerms:
         assert len(result) == 2
         assert "Net 30" in result
         assert "Net 15" in result
+
+        # A second import reuses the cached connection instead of paying for
+        # another COM handshake.
+        save_payment_terms_to_quickbooks(payment_terms)
         mock_qb_app.OpenConnection.assert_called_once()
         mock_qb_app.BeginSession.assert_called_once()
+
+        # The session stays open for later imports; only the shutdown hook
+        # releases it.
+        mock_qb_app.EndSession.assert_not_called()
+        excel_processor._close_qb_connection()
         mock_qb_app.EndSession.assert_called_once()
         mock_qb_app.CloseConnection.assert_called_once()
 
+    @patch("xlsx_reader.excel_processor.win32com.client.Dispatch")
+    def test_save_payment_terms_to_quickbooks_chunks_requests(self, mock_dispatch):
+        """Test that large batches are split into bounded QBXML requests."""
+        mock_qb_app = Mock()
+        mock_qb_app.BeginSession.return_value = "test_session"
+
+        def respond(_session, qbxml):
+            names = re.findall(r"<Name>([^<]*)</Name>", qbxml)
+            parts = "".join(
+                f'<StandardTermsAddRs statusCode="0" statusSeverity="Info">'
+                f"<StandardTermsRet><Name>{name}</Name></StandardTermsRet>"
+                f"</StandardTermsAddRs>"
+                for name in names
+            )
+            return f'<?xml version="1.0"?><QBXML><QBXMLMsgsRs>{parts}</QBXMLMsgsRs></QBXML>'
+
+        mock_qb_app.ProcessRequest.side_effect = respond
+        mock_dispatch.return_value = mock_qb_app
+
+        payment_terms = [
+            PaymentTerm(name=f"Net {days}", discount_days=days) for days in range(1, 6)
+        ]
+
+        result = save_payment_terms_to_quickbooks(payment_terms, chunk_size=2)
+
+        assert mock_qb_app.ProcessRequest.call_count == 3
+        assert result == [term.name for term in payment_terms]
+
     @patch("xlsx_reader.excel_processor.win32com.client.Dispatch")
     def test_save_payment_terms_to_quickbooks_connection_error(self, mock_dispatch):
         """Test handling of QuickBooks connection error."""